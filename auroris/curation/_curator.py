@@ -1,4 +1,3 @@
-import json
 from typing import Annotated, List, Optional, Tuple, Union
 
 import datamol as dm
@@ -12,6 +11,21 @@ from auroris.report import CurationReport
 from auroris.types import VerbosityLevel
 from auroris.utils import is_parquet_file
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# To know which Action object to create, we need a discriminated union.
+# This is the recommended way to add all subclasses in the type.
+# See e.g. https://github.com/pydantic/pydantic/issues/2200
+# and https://github.com/pydantic/pydantic/issues/2036
+# The union is built once at import time and Pydantic compiles its validator once per model class.
+ActionType = Annotated[
+    Union[tuple(BaseAction.__subclasses__())],  # type: ignore
+    Field(..., discriminator="name"),
+]
+
 
 class Curator(BaseModel):
     """
@@ -24,16 +38,7 @@ class Curator(BaseModel):
         parallelized_kwargs: Keyword arguments to affect parallelization in the steps.
     """
 
-    # To know which Action object to create, we need a discriminated union.
-    # This is the recommended way to add all subclasses in the type.
-    # See e.g. https://github.com/pydantic/pydantic/issues/2200
-    # and https://github.com/pydantic/pydantic/issues/2036
-    steps: List[
-        Annotated[
-            Union[tuple(BaseAction.__subclasses__())],  # type: ignore
-            Field(..., discriminator="name"),
-        ]
-    ]
+    steps: List[ActionType]
 
     src_dataset_path: Optional[str] = None
     verbosity: VerbosityLevel = VerbosityLevel.NORMAL
@@ -98,7 +103,10 @@ class Curator(BaseModel):
         # The report summarizes the changes made to the dataset
         report = CurationReport()
 
-        # Changes are not made in place
+        # Changes are not made in place.
+        # The actions only ever add or replace whole columns, but a shallow copy would make the returned
+        # dataset share the buffers of all untouched columns with the input. Without Copy-on-Write, any
+        # later in-place edit of the result (e.g. with `.loc`) would then silently modify the input as well.
         dataset = dataset.copy(deep=True)
 
         action: BaseAction
@@ -139,9 +147,13 @@ class Curator(BaseModel):
         Args:
             path:The path to load from
         """
+        if orjson is not None:
+            with fsspec.open(path, "rb") as f:
+                data = orjson.loads(f.read())
+            return cls.model_validate(data)
+
         with fsspec.open(path, "r") as f:
-            data = json.load(f)
-        return cls(**data)
+            return cls.model_validate_json(f.read())
 
     def to_json(self, path: str):
         """Saves the curation workflow to a JSON file.
@@ -149,5 +161,10 @@ class Curator(BaseModel):
         Args:
             path: The destination to save to.
         """
+        if orjson is not None:
+            with fsspec.open(path, "wb") as f:
+                f.write(orjson.dumps(self.model_dump(), option=orjson.OPT_SERIALIZE_NUMPY))
+            return
+
         with fsspec.open(path, "w") as f:
-            json.dump(self.model_dump(), f)
+            f.write(self.model_dump_json())
@@ -1,6 +1,5 @@
 from typing import Dict, List, Literal, Optional
 
-import datamol as dm
 import numpy as np
 import pandas as pd
 from pydantic import Field
@@ -9,7 +8,12 @@ from auroris.curation.actions._base import BaseAction
 from auroris.curation.actions._outlier import modified_zscore
 from auroris.report import CurationReport
 from auroris.types import VerbosityLevel
-from auroris.utils import is_regression
+from auroris.utils import is_regression, mols2bytes
+
+try:
+    import numba
+except ImportError:
+    numba = None
 
 
 def detect_streoisomer_activity_cliff(
@@ -29,33 +33,78 @@ def detect_streoisomer_activity_cliff(
         threshold: Threshold to identify the activity cliff. Currently, the difference of zscores between isomers are used for identification.
         prefix: Prefix for the adding columns
     """
-    dataset_ori = dataset.copy(deep=True)
-    ac_cols = {y_col: [] for y_col in y_cols}
-    group_index_list = [group.index.values for _, group in dataset.groupby(stereoisomer_id_col, sort=False)]
+    # Factorize the group identifiers once, so all reductions below can work on integer group codes.
+    # Missing identifiers get the code -1 and never form a group.
+    # The per-group arrays have one trailing slot that remains empty, so indexing it with -1 is safe.
+    codes, uniques = pd.factorize(dataset[stereoisomer_id_col])
+
+    # An activity cliff requires at least two stereoisomers in the group
+    group_sizes = np.bincount(codes[codes >= 0], minlength=len(uniques) + 1)
+    has_isomers = group_sizes[codes] > 1
+
+    ac_columns = {}
     for y_col in y_cols:
         is_reg = is_regression(dataset[y_col].dropna().values)
         if is_reg:
-            y_zscores = modified_zscore(dataset[y_col].values)
-
-        for group_index in group_index_list:
-            group = dataset.iloc[group_index, :]
-            if len(group) == 1:
-                ac = None
-            else:
-                if is_reg:
-                    # In regression, we use the difference between the z-scores
-                    zscores = y_zscores[group.index]
-                    ac = (np.nanmax(zscores) - np.nanmin(zscores)) > threshold
-                else:
-                    # For classification, we use the number of unique classes
-                    ac = len(np.unique(group[y_col].dropna().values)) > 1
-            ac_cols[y_col].extend([ac] * len(group))
+            # In regression, we use the difference between the z-scores
+            values = modified_zscore(dataset[y_col].values)
+            threshold_ = threshold
+        else:
+            # For classification, we check whether there is more than one class.
+            # The labels are factorized, so this is the case if the group has a non-zero range of label codes.
+            label_codes, _ = pd.factorize(dataset[y_col])
+            values = np.where(label_codes >= 0, label_codes, np.nan)
+            threshold_ = 0
 
-    for y_col in y_cols:
-        rows = [ind for ind_list in group_index_list for ind in ind_list]
-        dataset_ori.loc[rows, f"{prefix}{y_col}"] = np.array(ac_cols[y_col]).astype(bool)
+        ac = _group_range(codes, values, len(uniques))[codes] > threshold_
 
-    return dataset_ori
+        ac_columns[f"{prefix}{y_col}"] = ac & has_isomers
+
+    # All new columns are added at once to a copy, so the input dataset is left unchanged
+    return dataset.assign(**ac_columns)
+
+
+def _group_range(codes: np.ndarray, values: np.ndarray, num_groups: int) -> np.ndarray:
+    """
+    Compute the difference between the largest and smallest value of each group, ignoring missing values.
+    Groups without any values get a range of NaN, as does the trailing slot for the missing group code -1.
+
+    Info: Numba acceleration
+        If Numba is installed, the ranges are computed in a single pass with a JIT-compiled kernel.
+    """
+    if _group_range_kernel is not None:
+        return _group_range_kernel(codes, values, num_groups)
+
+    groups = pd.Series(values).groupby(codes, sort=False)
+    ranges = groups.max() - groups.min()
+    group_codes = ranges.index.to_numpy()
+    in_group = group_codes >= 0
+
+    group_range = np.full(num_groups + 1, np.nan)
+    group_range[group_codes[in_group]] = ranges.to_numpy()[in_group]
+    return group_range
+
+
+if numba is not None:
+
+    @numba.njit(cache=True)
+    def _group_range_kernel(codes: np.ndarray, values: np.ndarray, num_groups: int):
+        """Single-pass implementation of the grouped range, compiled with Numba."""
+        group_max = np.full(num_groups + 1, np.nan)
+        group_min = np.full(num_groups + 1, np.nan)
+        for i in range(codes.size):
+            code, value = codes[i], values[i]
+            if code < 0 or np.isnan(value):
+                continue
+            # The comparisons are negated so that the NaN initial values are always replaced
+            if not group_max[code] >= value:
+                group_max[code] = value
+            if not group_min[code] <= value:
+                group_min[code] = value
+        return group_max - group_min
+
+else:
+    _group_range_kernel = None
 
 
 class StereoIsomerACDetection(BaseAction):
@@ -113,25 +162,27 @@ class StereoIsomerACDetection(BaseAction):
                     )
 
                     if self.mol_col is not None:
+                        # Only the few activity cliffs are sorted, rather than the full dataset
                         to_plot = (
-                            dataset.sort_values(by=self.stereoisomer_id_col)
-                            .loc[has_cliff, [self.mol_col, col]]
+                            dataset[has_cliff]
+                            .sort_values(by=self.stereoisomer_id_col, kind="stable")
+                            .loc[:, [self.mol_col, col]]
                             .reset_index(names=["mol_index"])
                         )
                         to_plot["mol_index"] = to_plot["mol_index"].astype(int).astype(str)
-                        legends = (
-                            to_plot[["mol_index", col]]
-                            .apply(lambda x: f"mol_index: {x['mol_index']}\n{col}: {str(x[col])}", axis=1)
-                            .tolist()
-                        )
                         report.log(f"The molecule index are : {' ,'.join(to_plot['mol_index'].tolist())}")
-                        image = dm.to_image(
-                            to_plot[self.mol_col].values, legends=legends, use_svg=False, returnPNG=True
-                        ).data
 
-                        report.log_image(
-                            image_or_figure=image, title=f"Activity shifts among stereoisomers  - {col}"
-                        )
+                        # Rendering the molecules is expensive, so we skip it if the verbosity is silent
+                        if verbosity > VerbosityLevel.SILENT:
+                            legends = [
+                                f"mol_index: {mol_index}\n{col}: {value}"
+                                for mol_index, value in zip(to_plot["mol_index"], to_plot[col])
+                            ]
+                            image = mols2bytes(to_plot[self.mol_col].values, legends=legends)
+
+                            report.log_image(
+                                image_or_figure=image, title=f"Activity shifts among stereoisomers  - {col}"
+                            )
 
                 else:
                     report.log(
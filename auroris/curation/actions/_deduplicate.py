@@ -1,5 +1,6 @@
 from typing import Dict, List, Literal, Optional, Union
 
+import numpy as np
 import pandas as pd
 
 from auroris.curation.actions._base import BaseAction
@@ -29,24 +30,24 @@ def deduplicate(
         method: The method to aggregate the data.
     """
 
-    groups = []
-
     if y_cols is None or deduplicate_on is None:
         return dataset.drop_duplicates(subset=deduplicate_on, keep=keep).reset_index(drop=True)
 
     if len(set(y_cols).intersection(set(deduplicate_on))) > 0:
         raise ValueError("y_cols and deduplicate_on must be non-overlapping.")
 
-    for _, df in dataset.groupby(by=deduplicate_on):
-        data_vals = df[y_cols].agg(method, axis=0, skipna=True)
-        if isinstance(y_cols, list):
-            data_vals = data_vals.tolist()
-
-        df.loc[:, y_cols] = data_vals
-        groups.append(df)
-
-    merged_df = pd.concat(groups).sort_values(by=deduplicate_on)
-    merged_df = merged_df.drop_duplicates(subset=deduplicate_on, keep=keep).reset_index(drop=True)
+    # Aggregate the values of each group in a single pass and broadcast them back to the rows of the group.
+    groups = dataset.groupby(by=deduplicate_on)
+    merged_df = dataset.copy(deep=False)
+    merged_df[y_cols] = groups[y_cols].transform(method)
+
+    # The groups are numbered in the sorted order of their keys, so we can deduplicate and sort on these
+    # integer group numbers rather than on the (typically string) keys themselves.
+    # Rows with a missing value in the columns to deduplicate on don't belong to any group and are dropped.
+    group_numbers = groups.ngroup()
+    is_kept = group_numbers.notna() & ~group_numbers.duplicated(keep=keep)
+    merged_df = merged_df[is_kept]
+    merged_df = merged_df.iloc[np.argsort(group_numbers[is_kept].to_numpy())].reset_index(drop=True)
     return merged_df
 
 
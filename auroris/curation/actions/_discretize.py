@@ -27,9 +27,8 @@ def discretize(
 
         thresholds: Interval boundaries that include the right bin edge.
 
-        inplace: Set to True to perform inplace discretization and avoid a copy
-            (if the input is already a numpy array or a scipy.sparse CSR / CSC
-            matrix and if axis is 1).
+        inplace: Has no effect. The input is never copied or modified,
+            since the labels are always written to a new array.
 
         allow_nan: Set to True to allow nans in the array for discretization. Otherwise,
             an error will be raised instead.
@@ -51,28 +50,26 @@ def discretize(
             f"{label_order} is not a valid label_order. Choose from 'ascending' or 'descending'."
         )
 
+    # The labels are always written to a new array, so the input never needs to be copied
     X = check_array(
         X,
         accept_sparse=["csr", "csc"],
-        copy=not inplace,
+        copy=False,
         force_all_finite="allow-nan" if allow_nan else True,
         ensure_2d=False,
     )
 
     nan_idx = np.isnan(X)
 
-    thresholds = thresholds
-    binarize = True if len(thresholds) == 1 else False
+    X = np.digitize(X, thresholds)
 
     if label_order == "descending":
-        thresholds = np.flip(thresholds)
-    X = np.digitize(X, thresholds)
+        # Reversing the labels of the ascending bins gives the descending labels, both for binary and multiclass
+        np.subtract(len(thresholds), X, out=X)
 
     if allow_nan:
-        X = X.astype(np.float64)
-        X[nan_idx] = np.nan
-    if binarize and label_order == "descending":
-        X = 1 - X
+        # Convert the labels to floats and restore the missing values in a single pass
+        X = np.where(nan_idx, np.nan, X)
     return X
 
 
@@ -1,16 +1,36 @@
+import os
 from functools import partial
-from typing import Dict, List, Literal, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
 
 import datamol as dm
 import numpy as np
 import pandas as pd
-from rdkit.Chem import FindMolChiralCenters
+from packaging.version import Version
+from rdkit.Chem import FindMolChiralCenters, RegistrationHash
 
 from auroris.curation.actions._base import BaseAction
 from auroris.report import CurationReport
 from auroris.types import VerbosityLevel
+from auroris.utils import mols2bytes
 from auroris.visualization import visualize_chemspace
 
+_STANDARDIZE_KWARGS = {
+    "disconnect_metals": False,
+    "reionize": True,
+    "normalize": True,
+    "uncharge": True,  # standardize for protomeric forms
+    "stereo": True,
+}
+_STANDARDIZE_KWARGS_NO_STEREO = {**_STANDARDIZE_KWARGS, "stereo": False}
+
+# UMAP can't embed fewer samples in two dimensions
+_MIN_CHEMSPACE_SAMPLES = 4
+
+# Size of the ECFP fingerprints.
+# Datamol renamed the size argument when it moved to the fingerprint generators of RDKit.
+_ECFP_NUM_BITS = 2048
+_ECFP_SIZE_ARG = "fpSize" if Version(dm.__version__) >= Version("0.12.5") else "nBits"
+
 
 def curate_molecules(
     mols: List[Union[str, dm.Mol]],
@@ -38,25 +58,69 @@ def curate_molecules(
 
     """
     fn = partial(
-        _curate_molecule,
+        _curate_molecule_batch,
         remove_stereo=remove_stereo,
         fix_mol=fix_mol,
         count_stereoisomers=count_stereoisomers,
         count_stereocenters=count_stereocenters,
     )
 
-    mol_list = dm.parallelized(
+    # Molecule objects are converted to SMILES, which are much cheaper to send to the workers.
+    # Duplicated inputs are common in real-world datasets.
+    # We only curate each unique molecule once and map the results back.
+    keys = [dm.to_smiles(mol) if isinstance(mol, dm.Mol) else mol for mol in mols]
+    unique_keys = list(dict.fromkeys(keys))
+
+    # Curating a single molecule is fast, so we send batches to the workers to amortize the overhead.
+    unique_results = _parallelized_with_batches(fn, unique_keys, progress=progress, **parallelized_kwargs)
+    unique_results = dict(zip(unique_keys, unique_results))
+    mol_list = [unique_results[key] for key in keys]
+
+    # Go from list of dicts to dict of lists.
+    # All dicts are created by `_get_mol_dict` and share the same keys in the same order,
+    # so we can transpose the values in a single pass.
+    columns = zip(*[dic.values() for dic in mol_list])
+    mol_dict = dict(zip(mol_list[0].keys(), map(list, columns)))
+    num_invalid = mol_dict["smiles"].count(None)
+    return mol_dict, num_invalid
+
+
+def _parallelized_with_batches(
+    fn: Callable,
+    inputs_list: List[Any],
+    progress: bool = False,
+    flatten_results: bool = True,
+    **parallelized_kwargs,
+) -> List[Any]:
+    """
+    Run `fn` on batches of the inputs with `dm.parallelized_with_batches`.
+    A few batches per worker keeps the load balanced.
+
+    The `parallelized_kwargs` are those of `dm.parallelized`,
+    where `batch_size` is the number of tasks joblib dispatches at once.
+    """
+    parallelized_kwargs = dict(parallelized_kwargs)
+    if "batch_size" in parallelized_kwargs:
+        parallelized_kwargs["joblib_batch_size"] = parallelized_kwargs.pop("batch_size")
+
+    n_jobs = parallelized_kwargs.get("n_jobs", -1)
+    if n_jobs is None or n_jobs == 0:
+        num_workers = 1
+    elif n_jobs < 0:
+        num_workers = max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    else:
+        num_workers = n_jobs
+
+    batch_size = max(1, len(inputs_list) // (num_workers * 4))
+    return dm.parallelized_with_batches(
         fn=fn,
-        inputs_list=mols,
+        inputs_list=inputs_list,
+        batch_size=batch_size,
         progress=progress,
+        flatten_results=flatten_results,
         **parallelized_kwargs,
     )
 
-    # Go from list of dicts to dict of lists
-    mol_dict = {k: [dic[k] for dic in mol_list] for k in mol_list[0]}
-    num_invalid = len([smi for smi in mol_dict["smiles"] if smi is None])
-    return mol_dict, num_invalid
-
 
 def _standardize_mol(mol: Union[dm.Mol, str], remove_stereo: bool = False, fix_mol: bool = False):
     """
@@ -77,18 +141,18 @@ def _standardize_mol(mol: Union[dm.Mol, str], remove_stereo: bool = False, fix_m
         mol = dm.remove_stereochemistry(mol)
 
     # standardize with/without stereochemistry information (tautomeric, protomeric forms)
-    mol = dm.standardize_mol(
-        mol=mol,
-        disconnect_metals=False,
-        reionize=True,
-        normalize=True,
-        uncharge=True,  # standardize for protomeric forms
-        stereo=not remove_stereo,
-    )
+    standardize_kwargs = _STANDARDIZE_KWARGS_NO_STEREO if remove_stereo else _STANDARDIZE_KWARGS
+    mol = dm.standardize_mol(mol=mol, **standardize_kwargs)
 
     return mol
 
 
+def _curate_molecule_batch(mols: List[Union[dm.Mol, str]], **kwargs) -> List[dict]:
+    """Curate a batch of molecules. See `_curate_molecule` for the keyword arguments."""
+    with dm.without_rdkit_log():
+        return [_curate_molecule(mol, **kwargs) for mol in mols]
+
+
 def _curate_molecule(
     mol: Union[dm.Mol, str],
     remove_stereo: bool = False,
@@ -110,46 +174,49 @@ def _curate_molecule(
         mol_dict: Dictionary with the curated molecule and additional metadata
     """
 
-    with dm.without_rdkit_log():
-        try:
-            mol = _standardize_mol(mol, remove_stereo=remove_stereo, fix_mol=fix_mol)
-        except Exception:
-            # The molecule could not be preprocessed. We assume it's an invalid molecule and return an empty dict
-            return _get_mol_dict()
-
-        smiles = dm.to_smiles(mol, canonical=True)
-        molhash_id = dm.hash_mol(mol)
-        molhash_id_no_stereo = dm.hash_mol(mol, hash_scheme="no_stereo")
-
-        num_stereoisomers = None
-        num_undefined_stereoisomers = None
-        num_all_centers = None
-        num_defined_centers = None
-        num_undefined_centers = None
-        undefined_e_d = None
-        undefined_e_z = None
-
-        if count_stereoisomers:
-            # number of possible stereoisomers
-            num_stereoisomers = dm.count_stereoisomers(
-                mol=mol, undefined_only=False, rationalise=True, clean_it=True
-            )
+    try:
+        mol = _standardize_mol(mol, remove_stereo=remove_stereo, fix_mol=fix_mol)
+    except Exception:
+        # The molecule could not be preprocessed. We assume it's an invalid molecule and return an empty dict
+        return _get_mol_dict()
+
+    smiles = dm.to_smiles(mol, canonical=True)
+    molhash_id, molhash_id_no_stereo = _hash_mol(mol)
+
+    num_stereoisomers = None
+    num_undefined_stereoisomers = None
+    num_all_centers = None
+    num_defined_centers = None
+    num_undefined_centers = None
+    undefined_e_d = None
+    undefined_e_z = None
+
+    if count_stereoisomers:
+        # number of possible stereoisomers
+        num_stereoisomers = dm.count_stereoisomers(
+            mol=mol, undefined_only=False, rationalise=True, clean_it=True
+        )
 
-            # number of undefined stereoisomers
+        # number of undefined stereoisomers
+        # Undefined stereo elements are a subset of all stereo elements,
+        # so there is no need to count again if the molecule has no stereoisomers.
+        if num_stereoisomers == 1:
+            num_undefined_stereoisomers = 1
+        else:
             num_undefined_stereoisomers = dm.count_stereoisomers(
                 mol=mol, undefined_only=True, rationalise=True, clean_it=True
             )
 
-        if count_stereocenters:
-            # number of stereocenters
-            num_all_centers, num_defined_centers, num_undefined_centers = _num_stereo_centers(mol)
+    if count_stereocenters:
+        # number of stereocenters
+        num_all_centers, num_defined_centers, num_undefined_centers = _num_stereo_centers(mol)
 
-            # None of the stereochemistry is defined in the molecule
-            undefined_e_d = num_defined_centers == 0 and num_all_centers > 0
+        # None of the stereochemistry is defined in the molecule
+        undefined_e_d = num_defined_centers == 0 and num_all_centers > 0
 
-        if count_stereocenters and count_stereoisomers:
-            # Undefined EZ stereochemistry which has no stereocenter.
-            undefined_e_z = num_all_centers == 0 and num_undefined_centers
+    if count_stereocenters and count_stereoisomers:
+        # Undefined EZ stereochemistry which has no stereocenter.
+        undefined_e_z = num_all_centers == 0 and num_undefined_centers
 
     return _get_mol_dict(
         smiles=smiles,
@@ -165,6 +232,20 @@ def _curate_molecule(
     )
 
 
+def _hash_mol(mol: dm.Mol) -> Tuple[str, str]:
+    """
+    Get the hash of a molecule with and without stereochemistry.
+    Equivalent to `dm.hash_mol` with the `all` and `no_stereo` schemes,
+    but the expensive molecule layers are only computed once for both hashes.
+    """
+    layers = RegistrationHash.GetMolLayers(mol)
+    molhash_id = RegistrationHash.GetMolHash(layers, hash_scheme=RegistrationHash.HashScheme.ALL_LAYERS)
+    molhash_id_no_stereo = RegistrationHash.GetMolHash(
+        layers, hash_scheme=RegistrationHash.HashScheme.STEREO_INSENSITIVE_LAYERS
+    )
+    return molhash_id, molhash_id_no_stereo
+
+
 def _get_mol_dict(
     smiles: Optional[str] = None,
     molhash_id: Optional[str] = None,
@@ -209,15 +290,41 @@ def _num_stereo_centers(mol: dm.Mol) -> Tuple[int]:
         <rdkit.Chem.FindMolChiralCenters>
 
     """
-    num_all_centers = len(FindMolChiralCenters(mol, force=True, includeUnassigned=True))
+    # Unassigned centers are labeled with "?", so a single perception pass is enough.
+    centers = FindMolChiralCenters(mol, force=True, includeUnassigned=True)
+    num_all_centers = len(centers)
     if num_all_centers == 0:
         return 0, 0, 0
 
-    num_defined_centers = len(FindMolChiralCenters(mol, force=True, includeUnassigned=False))
-    nun_undefined_centers = num_all_centers - num_defined_centers
+    nun_undefined_centers = sum(1 for _, label in centers if label == "?")
+    num_defined_centers = num_all_centers - nun_undefined_centers
     return num_all_centers, num_defined_centers, nun_undefined_centers
 
 
+def _compute_ecfp(smiles: List[str], progress: bool = False, **parallelized_kwargs) -> np.ndarray:
+    """Compute the ECFP fingerprints of the unique SMILES in batches and map them back to the inputs."""
+    unique_smiles = list(dict.fromkeys(smiles))
+    if len(unique_smiles) == 0:
+        return np.empty((0, _ECFP_NUM_BITS), dtype=np.uint8)
+
+    batches = _parallelized_with_batches(
+        _ecfp_batch, unique_smiles, progress=progress, flatten_results=False, **parallelized_kwargs
+    )
+    unique_fps = np.concatenate(batches)
+
+    index = {smi: i for i, smi in enumerate(unique_smiles)}
+    return unique_fps[[index[smi] for smi in smiles]]
+
+
+def _ecfp_batch(smiles: List[str]) -> np.ndarray:
+    """Compute the ECFP fingerprints of a batch of SMILES into a single preallocated array."""
+    fps = np.empty((len(smiles), _ECFP_NUM_BITS), dtype=np.uint8)
+    with dm.without_rdkit_log():
+        for i, smi in enumerate(smiles):
+            fps[i] = dm.to_fp(smi, **{_ECFP_SIZE_ARG: _ECFP_NUM_BITS})
+    return fps
+
+
 class MoleculeCuration(BaseAction):
     """
     Automated molecule curation and chemistry space distribution.
@@ -263,39 +370,49 @@ class MoleculeCuration(BaseAction):
             **parallelized_kwargs,
         )
         mol_dict = {self.get_column_name(k): v for k, v in mol_dict.items()}
-        df = pd.DataFrame(mol_dict)
 
         if num_invalid > 0:
             if report is not None:
                 report.log(f"Couldn't preprocess {num_invalid} / {len(dataset)} molecules.")
 
-        dataset = pd.concat([dataset, df], axis=1)
+        for col, values in mol_dict.items():
+            dataset[col] = values
 
         # Log information to the report
         # - New columns with the curated molecule information
 
         if report is not None:
-            for col in df.columns:
+            for col in mol_dict:
                 report.log_new_column(col)
 
             smiles_col = self.get_column_name("smiles")
             smiles = dataset[smiles_col].dropna().values
 
-            if self.X_col is None:
-                featurizer = "ECFP"
-                with dm.without_rdkit_log():
-                    X = np.array([dm.to_fp(smi) for smi in smiles])
-                report.log("Default `ecfp` fingerprint is used to visualize the chemical space.")
+            num_samples = len(smiles) if self.X_col is None else len(dataset)
+
+            if num_samples < _MIN_CHEMSPACE_SAMPLES:
+                # Skip the featurization, since the chemical space can't be embedded anyway
+                report.log(
+                    f"Skipped the chemical space visualization for only {num_samples} molecules. "
+                    f"At least {_MIN_CHEMSPACE_SAMPLES} are required."
+                )
 
             else:
-                featurizer = self.X_col
-                X = dataset[self.X_col].values
+                if self.X_col is None:
+                    featurizer = "ECFP"
+                    X = _compute_ecfp(smiles, progress=verbosity > 1, **parallelized_kwargs)
+                    report.log("Default `ecfp` fingerprint is used to visualize the chemical space.")
+
+                else:
+                    featurizer = self.X_col
+                    X = dataset[self.X_col].values
 
-            # list of data per column
-            y = dataset[self.y_cols].T.values.tolist() if self.y_cols else None
+                # list of data per column
+                y_cols = [self.y_cols] if isinstance(self.y_cols, str) else self.y_cols
+                y = [dataset[col].to_numpy() for col in y_cols] if y_cols else None
 
-            fig = visualize_chemspace(X=X, y=y, labels=self.y_cols)
-            report.log_image(fig, title=f"Distribution in Chemical Space - {featurizer}")
+                fig = visualize_chemspace(X=X, y=y, labels=y_cols)
+                report.log_image(fig, title=f"Distribution in Chemical Space - {featurizer}")
 
             if self.count_stereocenters:
                 # Plot all compounds with undefined stereocenters for visual inspection
@@ -307,15 +424,11 @@ class MoleculeCuration(BaseAction):
                 report.log(f"Molecules with undefined stereocenter detected: {num_mol_undefined}.")
 
                 if num_mol_undefined > 0:
-                    legends = []
-                    for _, row in to_plot.iterrows():
-                        undefined = row[undefined_col]
-                        defined = row[defined_col]
-                        legends.append(f"Undefined:{undefined}\n Definded:{defined}")
-
-                    image = dm.to_image(
-                        to_plot[smiles_col].values, legends=legends, use_svg=False, returnPNG=True
-                    ).data
+                    legends = [
+                        f"Undefined:{undefined}\n Defined:{defined}"
+                        for undefined, defined in zip(to_plot[undefined_col], to_plot[defined_col])
+                    ]
+                    image = mols2bytes(to_plot[smiles_col].values, legends=legends)
 
                     report.log_image(
                         image,
@@ -1,9 +1,11 @@
+from functools import partial
+from inspect import signature
 from typing import Any, Dict, List, Literal, Optional, TypeAlias
 
+import datamol as dm
 import numpy as np
 import pandas as pd
 from pydantic import Field, PrivateAttr
-from scipy import stats
 from sklearn.base import OutlierMixin, check_is_fitted
 from sklearn.covariance import EllipticEnvelope
 from sklearn.ensemble import IsolationForest
@@ -15,7 +17,15 @@ from auroris.report import CurationReport
 from auroris.types import VerbosityLevel
 from auroris.visualization import visualize_distribution_with_outliers
 
-OutlierDetectionMethod: TypeAlias = Literal["iso", "lof", "svm", "ee", "zscore"]
+try:
+    import isotree
+except ImportError:
+    isotree = None
+
+OutlierDetectionMethod: TypeAlias = Literal["iso", "isotree", "lof", "svm", "ee", "zscore"]
+
+# Scales the median absolute deviation to the standard deviation of normally distributed data
+_MAD_CONSISTENCY_CORRECTION = 1.4826
 
 
 class ZscoreOutlier(OutlierMixin):
@@ -45,7 +55,8 @@ class ZscoreOutlier(OutlierMixin):
         if self.use_modified_zscore:
             self._zscore = modified_zscore(X)
         else:
-            self._zscore = stats.zscore(X)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                self._zscore = (X - X.mean(axis=0)) / X.std(axis=0)
 
     def predict(self, X: np.ndarray) -> np.ndarray:
         """
@@ -72,18 +83,92 @@ class ZscoreOutlier(OutlierMixin):
         Args:
             X: The observations that we want to classify as inliers or outliers.
         """
-        self.fit(X)
-        return self.predict(X)
+        if self.use_modified_zscore:
+            self.fit(X)
+            return self.predict(X)
+
+        # For the standard z-score, we compare the deviation to the scaled standard deviation directly.
+        # This saves us from allocating the z-scores and the absolute z-scores.
+        deviation = np.abs(X - X.mean(axis=0))
+        is_inlier = np.ones(X.shape, dtype=int)
+        is_inlier[deviation > self.threshold * X.std(axis=0)] = -1
+        return is_inlier
+
+
+class IsoTreeOutlier(OutlierMixin):
+    """
+    Detect outliers with the multi-threaded isolation forest implementation of `isotree`.
+
+    Uses a scikit-learn compatible interface. The defaults mimic those of `sklearn.ensemble.IsolationForest`.
+
+    Args:
+        threshold: If the standardized outlier score is larger than this threshold, it is an outlier.
+            The default of 0.5 corresponds to the `contamination="auto"` default of Scikit-learn.
+        n_jobs: The number of threads to use. Passed to `isotree.IsolationForest` as `nthreads`.
+        **kwargs: Keyword arguments for `isotree.IsolationForest`.
+    """
+
+    def __init__(self, threshold: float = 0.5, n_jobs: int = -1, **kwargs: Any):
+        if isotree is None:
+            raise ImportError(
+                "Please run `pip install isotree` to use the `isotree` outlier detection method."
+            )
+
+        self.threshold = threshold
+        self.n_jobs = n_jobs
+        self.kwargs = {"ntrees": 100, "ndim": 1, "nthreads": n_jobs, **kwargs}
+        self._model = None
+
+    def fit(self, X: np.ndarray):
+        """
+        Fits the isolation forest.
+
+        Args:
+            X: The observations that we want to classify as inliers or outliers.
+        """
+        kwargs = {"sample_size": min(256, len(X)), **self.kwargs}
+        self._model = isotree.IsolationForest(**kwargs).fit(X)
+        return self
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """
+        Args:
+            X: The observations that we want to classify as inliers or outliers.
+
+        Returns:
+            An array that for each observation, tells whether or not (+1 or -1) it should
+            be considered as an inlier according to the fitted model.
+        """
+        check_is_fitted(self, attributes=["_model"])
+        scores = self._model.predict(X, output="score")
+        return np.where(scores > self.threshold, -1, 1)
+
+    def fit_predict(self, X: np.ndarray) -> np.ndarray:
+        """
+        First fits the isolation forest, then predicts the inliers/outliers.
+
+        Args:
+            X: The observations that we want to classify as inliers or outliers.
+        """
+        return self.fit(X).predict(X)
 
 
 _OUTLIER_METHODS: Dict[OutlierDetectionMethod, OutlierMixin] = {
     "iso": IsolationForest,
+    "isotree": IsoTreeOutlier,
     "lof": LocalOutlierFactor,
     "svm": OneClassSVM,
     "ee": EllipticEnvelope,
     "zscore": ZscoreOutlier,
 }
 
+# The detectors that support parallelism through an `n_jobs` parameter
+_OUTLIER_METHODS_WITH_N_JOBS = {
+    method
+    for method, detector_cls in _OUTLIER_METHODS.items()
+    if "n_jobs" in signature(detector_cls).parameters
+}
+
 
 def detect_outliers(X: np.ndarray, method: OutlierDetectionMethod = "zscore", **kwargs: Any):
     """Functional interface for detecting outliers
@@ -97,21 +182,40 @@ def detect_outliers(X: np.ndarray, method: OutlierDetectionMethod = "zscore", **
     if X.ndim != 1:
         raise ValueError("X must be a 1D array for outlier detection.")
 
+    # Unless specified otherwise, use all available cores for the detectors that support it
+    if method in _OUTLIER_METHODS_WITH_N_JOBS:
+        kwargs = {"n_jobs": -1, **kwargs}
+
     detector_cls = _OUTLIER_METHODS[method]
     detector = detector_cls(**kwargs)
-    indices = np.flatnonzero(~np.isnan(X))
+    # Missing values are ignored and never considered an outlier
+    mask = ~np.isnan(X)
+    out_ = detector.fit_predict(X[mask, None])
 
-    in_ = X[indices].reshape(-1, 1)
-    out_ = detector.fit_predict(in_)
+    is_outlier = np.zeros(X.shape, dtype=bool)
+    is_outlier[mask] = out_.ravel() == -1
+    return is_outlier
 
-    is_inlier = np.full_like(X, np.nan)
-    is_inlier[indices] = out_.flatten()
 
-    is_outlier = is_inlier == -1
-    return is_outlier
+def _detect_zscore_outliers(
+    X: np.ndarray, threshold: float = 3, use_modified_zscore: bool = False
+) -> np.ndarray:
+    """
+    Detect z-score outliers for each of the columns of a 2D array at once.
+    This is equivalent to using `ZscoreOutlier` on each of the columns separately.
+    Missing values are ignored and never considered an outlier.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if use_modified_zscore:
+            zscore = np.abs(modified_zscore(X, axis=0))
+        else:
+            zscore = np.abs(X - np.nanmean(X, axis=0)) / np.nanstd(X, axis=0)
+    return zscore > threshold
 
 
-def modified_zscore(data: np.ndarray, consistency_correction: float = 1.4826):
+def modified_zscore(
+    data: np.ndarray, consistency_correction: float = _MAD_CONSISTENCY_CORRECTION, axis: Optional[int] = None
+):
     """
     The modified z score is calculated from the median absolute deviation (MAD).
     These values must be multiplied by a constant to approximate the standard deviation.
@@ -121,14 +225,42 @@ def modified_zscore(data: np.ndarray, consistency_correction: float = 1.4826):
 
     modified Z score = (X-MED) / (consistency_correction*MAD)
 
+    The medians are computed along `axis`, or over the flattened array if `axis` is None.
     """
-    median = np.nanmedian(data)
-
-    deviation_from_med = np.array(data) - median
+    # Integer inputs are cast, since the medians and the buffer below must be able to hold fractional values
+    data = np.asarray(data, dtype=np.float64)
+    if data.size == 0 or np.isnan(data).any():
+        median = np.nanmedian(data, axis=axis, keepdims=True)
+        deviation_from_med = data - median
+        mad = np.nanmedian(np.abs(deviation_from_med), axis=axis, keepdims=True)
+        return deviation_from_med / (consistency_correction * mad)
+
+    # Without missing values, we can select the medians with a partial sort.
+    # The reduced axis is moved last, so the partitions run over contiguous memory.
+    # The same buffer is reused for the absolute deviations.
+    values = data.ravel() if axis is None else np.moveaxis(data, axis, -1)
+    buffer = values.copy()
+    median = _partitioned_median(buffer)
+    deviation_from_med = values - median
+    np.abs(deviation_from_med, out=buffer)
+    mad = _partitioned_median(buffer)
 
-    mad = np.nanmedian(np.abs(deviation_from_med))
     mod_zscore = deviation_from_med / (consistency_correction * mad)
-    return mod_zscore
+    return mod_zscore.reshape(data.shape) if axis is None else np.moveaxis(mod_zscore, -1, axis)
+
+
+def _partitioned_median(buffer: np.ndarray) -> np.ndarray:
+    """
+    Compute the median along the last axis of a non-empty array in linear time by partitioning it in-place.
+    The reduced axis is kept with length one.
+    """
+    n = buffer.shape[-1]
+    k = n // 2
+    if n % 2:
+        buffer.partition(k)
+        return buffer[..., k : k + 1]
+    buffer.partition([k - 1, k])
+    return (buffer[..., k - 1 : k] + buffer[..., k : k + 1]) / 2
 
 
 class OutlierDetection(BaseAction):
@@ -156,12 +288,41 @@ class OutlierDetection(BaseAction):
         verbosity: VerbosityLevel = VerbosityLevel.NORMAL,
         parallelized_kwargs: Optional[Dict] = None,
     ):
-        for column in self.columns:
-            values = dataset[column].values
-            is_outlier = detect_outliers(values, self.method, **self.kwargs)
-
-            is_outlier_col_label = self.get_column_name(column)
-            dataset[is_outlier_col_label] = is_outlier
+        if len(self.columns) == 0:
+            return dataset
+
+        # The columns are independent and the detectors mostly run native code,
+        # so we detect the outliers for all columns in a thread pool.
+        parallelized_kwargs = parallelized_kwargs or {}
+        parallelized_kwargs = {**parallelized_kwargs, "scheduler": "threads"}
+        X = dataset[self.columns].to_numpy(dtype=np.float64)
+        all_values = list(X.T)
+        if self.method == "zscore":
+            # The z-scores are cheap to compute, so we vectorize over all columns at once
+            all_outliers = list(_detect_zscore_outliers(X, **self.kwargs).T)
+        else:
+            kwargs = self.kwargs
+            column_n_jobs = parallelized_kwargs.get("n_jobs", -1)
+            columns_in_parallel = len(self.columns) > 1 and column_n_jobs not in [None, 0, 1]
+            if self.method in _OUTLIER_METHODS_WITH_N_JOBS and columns_in_parallel:
+                # The columns are already processed in parallel.
+                # Unless specified otherwise, the detectors are single-threaded to not oversubscribe the CPUs.
+                kwargs = {"n_jobs": 1, **kwargs}
+
+            all_outliers = dm.parallelized(
+                fn=partial(detect_outliers, method=self.method, **kwargs),
+                inputs_list=all_values,
+                progress=verbosity > 1,
+                **parallelized_kwargs,
+            )
+
+        # Add all new columns at once to prevent fragmenting the dataset
+        is_outlier_col_labels = [self.get_column_name(column) for column in self.columns]
+        dataset[is_outlier_col_labels] = np.column_stack(all_outliers)
+
+        for column, is_outlier_col_label, values, is_outlier in zip(
+            self.columns, is_outlier_col_labels, all_values, all_outliers
+        ):
             num_outliers = sum(is_outlier)
 
             if report is not None:
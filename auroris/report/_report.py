@@ -46,7 +46,8 @@ class CurationReport(BaseModel):
     _active_section: Optional[Section] = PrivateAttr(None)
 
     def start_section(self, name: str):
-        self.sections.append(Section(title=name))
+        # The report creates these objects itself, so we can safely skip validation
+        self.sections.append(Section.model_construct(title=name))
         self._active_section = self.sections[-1]
 
     def end_section(self):
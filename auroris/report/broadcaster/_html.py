@@ -1,13 +1,13 @@
 import base64
 import os
 import re
-from copy import deepcopy
+from functools import lru_cache
 from importlib import resources
 
 import datamol as dm
 import fsspec
 
-from auroris.report import CurationReport
+from auroris.report import AnnotatedImage, CurationReport
 from auroris.utils import img2bytes, save_image
 
 from ._base import ReportBroadcaster
@@ -18,6 +18,15 @@ except ImportError:
     jinja2 = None
 
 
+@lru_cache(maxsize=None)
+def _load_template() -> "jinja2.Template":
+    """Read and compile the HTML report template once per process."""
+    path = resources.files("auroris.report.broadcaster.templates")
+    path = path.joinpath("report.html.jinja")
+    with path.open() as template_file:
+        return jinja2.Template(template_file.read())
+
+
 class HTMLBroadcaster(ReportBroadcaster):
     """
     Render a simple HTML page
@@ -46,7 +55,16 @@ class HTMLBroadcaster(ReportBroadcaster):
         self._embed_images = embed_images
 
     def broadcast(self):
-        report = deepcopy(self._report)
+        # The images are replaced by their `src` below, so only the report structure is copied.
+        # A deep copy would duplicate all logs and every image buffer just to discard them.
+        report = self._report.model_copy(
+            update={
+                "sections": [
+                    section.model_copy(update={"images": [image.model_copy() for image in section.images]})
+                    for section in self._report.sections
+                ]
+            }
+        )
 
         # Create destination dir.
         dm.fs.mkdir(self._destination, exist_ok=True)
@@ -56,34 +74,19 @@ class HTMLBroadcaster(ReportBroadcaster):
             dm.fs.mkdir(self._image_dir, exist_ok=True)
 
         # Save all images
-        image_counter = 0
-        for section in report.sections:
-            for image in section.images:
-                if self._embed_images:
-                    # Encode directly into the HTML
-                    image_data = img2bytes(image.image)
-                    image_data = base64.b64encode(image_data).decode("utf-8")
-                    src = f"data:image/png;base64,{image_data}"
-                else:
-                    # Save as separate file
-                    # add image title to the file name. (Replace space, slash, dot by hyphen)
-                    filename = re.sub(r"\ \-\ |[ ./]", "_", image.title) if image.title else ""
-                    filename = "-".join([str(image_counter), filename])
-                    path = dm.fs.join(self._image_dir, f"{filename}.png")
-                    save_image(image.image, path)
-                    src = self._img_to_html_src(path)
-
-                image.image = src
-                image_counter += 1
-
-        # Get HTML template file
-        path = resources.files("auroris.report.broadcaster.templates")
-        path = path.joinpath("report.html.jinja")
+        # PNG encoding and I/O release the GIL, so we process the images in a thread pool
+        images = [image for section in report.sections for image in section.images]
+        srcs = dm.parallelized(
+            self._image_to_html_src,
+            list(enumerate(images)),
+            scheduler="threads",
+            arg_type="args",
+        )
+        for image, src in zip(images, srcs):
+            image.image = src
 
         # Render the HTML
-        with path.open() as template_file:
-            template = jinja2.Template(template_file.read())
-        html = template.render(report=report)
+        html = _load_template().render(report=report)
 
         # Write the HTML
         path = dm.fs.join(self._destination, "index.html")
@@ -92,6 +95,25 @@ class HTMLBroadcaster(ReportBroadcaster):
 
         return path
 
+    def _image_to_html_src(self, image_counter: int, image: AnnotatedImage):
+        """
+        Get the `src` attribute for an `<img />` tag of an image,
+        either by embedding the image or by saving it as a separate file.
+        """
+        if self._embed_images:
+            # Encode directly into the HTML
+            image_data = img2bytes(image.image)
+            image_data = base64.b64encode(image_data).decode("utf-8")
+            return f"data:image/png;base64,{image_data}"
+
+        # Save as separate file
+        # add image title to the file name. (Replace space, slash, dot by hyphen)
+        filename = re.sub(r"\ \-\ |[ ./]", "_", image.title) if image.title else ""
+        filename = "-".join([str(image_counter), filename])
+        path = dm.fs.join(self._image_dir, f"{filename}.png")
+        save_image(image.image, path)
+        return self._img_to_html_src(path)
+
     def _img_to_html_src(self, path: str):
         """
         Convert a path to a corresponding `src` attribute for an `<img />` tag.
@@ -1,6 +1,7 @@
 from io import BytesIO
-from typing import ByteString
+from typing import ByteString, Optional, Sequence
 
+import datamol as dm
 import fsspec
 import numpy as np
 import pyarrow.parquet as pq
@@ -31,6 +32,19 @@ def fig2img(fig: Figure) -> ImageType:
     )
 
 
+def mols2bytes(mols: Sequence, legends: Optional[Sequence[str]] = None, max_mols: int = 32) -> bytes:
+    """Draw the first `max_mols` molecules in a grid and encode it as a PNG image"""
+    # Datamol parses all molecules before keeping the first `max_mols`,
+    # so we only pass the molecules that are actually drawn.
+    mols = mols[:max_mols]
+    if legends is not None:
+        legends = legends[:max_mols]
+
+    image = dm.to_image(mols, legends=legends, max_mols=max_mols, use_svg=False, returnPNG=True)
+    # Depending on the environment, RDKit returns the PNG bytes or an IPython image
+    return getattr(image, "data", image)
+
+
 def img2bytes(image: ImageType):
     """Convert png image to bytes"""
     image_bytes = BytesIO()
@@ -48,8 +62,11 @@ def bytes2img(image_bytes: ByteString):
 
 def save_image(image: ImageType, path: str):
     """Save an image to a fsspec-compatible path"""
+    # Encode in memory first, so the image is written at once rather than chunk by chunk.
+    # This matters for remote file systems, where each write can be a request.
+    image_bytes = img2bytes(image)
     with fsspec.open(path, "wb") as fd:
-        image.save(fd, format="png")
+        fd.write(image_bytes)
 
 
 def is_parquet_file(path):
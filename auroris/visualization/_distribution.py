@@ -30,6 +30,9 @@ def visualize_continuous_distribution(
     xs = coords[0]
     ys = coords[1]
 
+    # Work on the underlying array to avoid the pandas overhead in each comparison
+    values = np.asarray(data)
+
     # Setup the bins
     bins = np.sort(bins)
     bins = np.append(bins, np.inf)
@@ -58,8 +61,7 @@ def visualize_continuous_distribution(
         masked_xs[0] = max(lower, np.min(xs))
         masked_xs[-1] = threshold
 
-        pct_mask = (data > lower) & (data <= threshold)
-        pct = np.sum(pct_mask) / len(data)
+        pct = np.count_nonzero((values > lower) & (values <= threshold)) / len(values)
 
         def _format(val):
             if val == -np.inf:
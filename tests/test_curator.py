@@ -1,5 +1,6 @@
 import os
 
+import pytest
 from pandas.core.api import DataFrame as DataFrame
 
 from auroris.curation import Curator
@@ -12,7 +13,11 @@ except ImportError:
     jinja2 = None
 
 
-def test_curator_save_load(tmpdir):
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_curator_save_load(use_orjson, tmpdir, monkeypatch):
+    if not use_orjson:
+        monkeypatch.setattr("auroris.curation._curator.orjson", None)
+
     curator = Curator(
         steps=[
             MoleculeCuration(input_column="smiles"),
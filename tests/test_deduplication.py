@@ -35,3 +35,23 @@ def test_deduplicate():
         assert data.loc[[index, max_ind - index], "data_col_1"].median() == merged.loc[index, "data_col_1"]
         assert data.loc[[index, max_ind - index], "data_col_2"].median() == merged.loc[index, "data_col_2"]
         assert data.loc[[index, max_ind - index], "data_col_3"].median() == merged.loc[index, "data_col_3"]
+
+
+def test_deduplicate_keep():
+    data = pd.DataFrame(
+        {
+            "ids": ["b", "a", "b", "a", None],
+            "data_col": [1.0, 2.0, 3.0, np.nan, 5.0],
+            "order": [0, 1, 2, 3, 4],
+        }
+    )
+
+    first = deduplicate(
+        dataset=data, deduplicate_on=["ids"], y_cols=["data_col"], keep="first", method="mean"
+    )
+    assert first["ids"].tolist() == ["a", "b"]
+    assert first["data_col"].tolist() == [2.0, 2.0]
+    assert first["order"].tolist() == [1, 0]
+
+    last = deduplicate(dataset=data, deduplicate_on=["ids"], y_cols=["data_col"], keep="last", method="mean")
+    assert last["order"].tolist() == [3, 2]
@@ -1,7 +1,11 @@
 import datamol as dm
+import numpy as np
+import pandas as pd
 
-from auroris.curation.actions._mol import _num_stereo_centers
+from auroris.curation.actions import MoleculeCuration
+from auroris.curation.actions._mol import _ECFP_NUM_BITS, _compute_ecfp, _num_stereo_centers
 from auroris.curation.functional import curate_molecules
+from auroris.report import CurationReport
 
 
 def test_run_chemistry_curation():
@@ -39,6 +43,16 @@ def test_run_chemistry_curation():
         mol = dm.to_mol(smiles)
         assert dm.same_mol(dm.remove_salts_solvents(mol), mol)
 
+    # check duplicated inputs are curated consistently and the order is preserved
+    dup_mols = mols + [dm.to_mol(smi) for smi in mols[::-1]]
+    mol_dict, _ = curate_molecules(mols=dup_mols)
+    assert len(mol_dict["smiles"]) == len(dup_mols)
+    assert mol_dict["smiles"][: len(mols)] == mol_dict["smiles"][len(mols) :][::-1]
+
+    # check the keyword arguments of `dm.parallelized` are accepted
+    sequential_dict, _ = curate_molecules(mols=dup_mols, n_jobs=None, batch_size=1)
+    assert sequential_dict == mol_dict
+
 
 def test_num_undefined_stereo_centers():
     # mol with no stereo centers
@@ -68,3 +82,34 @@ def test_num_undefined_stereo_centers():
     assert num_all == 2
     assert num_defined == 0
     assert num_undefined == 2
+
+
+def test_mol_curation_too_few_molecules_for_chemspace():
+    dataset = pd.DataFrame({"smiles": ["CCO", "c1ccccc1"]})
+    report = CurationReport()
+
+    with report.section("mol_curation"):
+        dataset = MoleculeCuration(input_column="smiles").transform(dataset, report)
+
+    section = report.sections[0]
+    assert len(section.images) == 0
+    assert any("Skipped the chemical space visualization" in log for log in section.logs)
+
+
+def test_mol_curation_undefined_stereocenters_report():
+    dataset = pd.DataFrame({"smiles": ["CC(F)C(F)(Cl)Br", "C[C@H](F)C(F)(Cl)Br", "CCO", "c1ccccc1", "CCN"]})
+    report = CurationReport()
+
+    with report.section("mol_curation"):
+        dataset = MoleculeCuration(input_column="smiles").transform(dataset, report)
+
+    section = report.sections[0]
+    assert "Molecules with undefined stereocenter detected: 2." in section.logs
+    assert section.images[-1].title == "Molecules with undefined stereocenters"
+
+
+def test_compute_ecfp():
+    smiles = ["CCO", "c1ccccc1", "CCO"]
+    X = _compute_ecfp(smiles)
+    assert X.shape == (len(smiles), _ECFP_NUM_BITS)
+    assert (X == np.array([dm.to_fp(smi) for smi in smiles])).all()
@@ -3,11 +3,15 @@ import pandas as pd
 import pytest
 
 from auroris.curation.actions import OutlierDetection
+from auroris.curation.actions._outlier import IsoTreeOutlier, modified_zscore
 from auroris.curation.functional import detect_outliers
 
 
-@pytest.mark.parametrize("method", ["iso", "lof", "svm", "ee", "zscore"])
+@pytest.mark.parametrize("method", ["iso", "isotree", "lof", "svm", "ee", "zscore"])
 def test_outlier_detection(method, dataset):
+    if method == "isotree":
+        pytest.importorskip("isotree")
+
     action = OutlierDetection(method=method, columns=["outlier_column"])
 
     df = action.transform(dataset)
@@ -23,6 +27,18 @@ def test_outlier_detection(method, dataset):
     assert (len(dataset) - 1) in outliers.index
 
 
+def test_isotree_outlier(dataset):
+    pytest.importorskip("isotree")
+
+    X = dataset[["outlier_column"]].values
+    detector = IsoTreeOutlier(n_jobs=2)
+    labels = detector.fit_predict(X)
+
+    assert labels.shape == (len(X),)
+    assert set(np.unique(labels)) <= {-1, 1}
+    assert detector._model.nthreads == 2
+
+
 @pytest.mark.parametrize("use_modified_zscore", [True, False])
 def test_zscore_outlier_detection(use_modified_zscore, dataset):
     action = OutlierDetection(
@@ -44,9 +60,62 @@ def test_zscore_outlier_detection(use_modified_zscore, dataset):
     assert (len(dataset) - 1) in outliers.index
 
 
+@pytest.mark.parametrize(
+    "columns, expected_n_jobs", [(["outlier_column"], -1), (["outlier_column", "other"], 1)]
+)
+def test_outlier_detection_n_jobs(columns, expected_n_jobs, dataset, monkeypatch):
+    from auroris.curation.actions import _outlier
+
+    n_jobs = []
+
+    def _detect_outliers(X, method, **kwargs):
+        n_jobs.append(kwargs.get("n_jobs", -1))
+        return detect_outliers(X, method=method, **kwargs)
+
+    # Only parallelize over the columns or within the detector, not both
+    monkeypatch.setattr(_outlier, "detect_outliers", _detect_outliers)
+    dataset["other"] = dataset["outlier_column"]
+    OutlierDetection(method="lof", columns=columns).transform(dataset)
+    assert n_jobs == [expected_n_jobs] * len(columns)
+
+
+def test_outlier_detection_no_columns(dataset):
+    action = OutlierDetection(method="zscore", columns=[])
+    df = action.transform(dataset.copy())
+    assert df.columns.tolist() == dataset.columns.tolist()
+
+
 def test_check_outlier_zscore():
     data = pd.DataFrame(np.random.normal(0, 0.1, size=100), columns=["data_col"])
     num_outlier = 5
     data.loc[: num_outlier - 1, "data_col"] = 10
     is_outlier = detect_outliers(X=data["data_col"].values, method="zscore")
     assert is_outlier.sum() == num_outlier
+
+
+def test_modified_zscore_missing_values():
+    X = np.random.normal(0, 1, size=20_001)
+    X[[3, 50]] = np.nan
+
+    # Missing values are ignored for the medians, but stay missing in the output
+    expected = (X - np.nanmedian(X)) / (1.4826 * np.nanmedian(np.abs(X - np.nanmedian(X))))
+    assert np.allclose(modified_zscore(X), expected, equal_nan=True)
+
+
+def test_modified_zscore_integer_input():
+    # An even number of integers has a fractional median
+    X = np.array([1, 2, 3, 100])
+    assert np.allclose(modified_zscore(X), modified_zscore(X.astype(float)))
+
+    is_outlier = detect_outliers(
+        np.array([1, 2, 3, 4, 5, 6, 7, 100]), method="zscore", use_modified_zscore=True
+    )
+    assert is_outlier.tolist() == [False] * 7 + [True]
+
+
+def test_modified_zscore_axis():
+    X = np.random.default_rng(0).normal(size=(51, 3))
+    X[[5, 20], 1] = np.nan
+    expected = np.stack([modified_zscore(X[:, i]) for i in range(X.shape[1])], axis=1)
+    assert np.allclose(modified_zscore(X, axis=0), expected, equal_nan=True)
+    assert np.allclose(modified_zscore(X[:-1, [0, 2]], axis=0)[:, 1], modified_zscore(X[:-1, 2]))
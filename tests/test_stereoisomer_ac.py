@@ -1,7 +1,11 @@
 import numpy as np
 import pandas as pd
+import pytest
 
+from auroris.curation.actions import StereoIsomerACDetection
 from auroris.curation.functional import detect_streoisomer_activity_cliff
+from auroris.report import CurationReport
+from auroris.types import VerbosityLevel
 
 
 def test_identify_stereoisomers_with_activity_cliff():
@@ -21,3 +25,49 @@ def test_identify_stereoisomers_with_activity_cliff():
     # check if identifed ids are correct
     ids = df[df["AC_data_col"]]["groupby_col"].unique()
     assert set(ids) == set(index_cliff)
+
+    # The input dataset is left unchanged and doesn't share its data with the result
+    assert "AC_data_col" not in data.columns
+    df.loc[0, "data_col"] = -1
+    assert data.loc[0, "data_col"] == vals[0]
+
+
+@pytest.mark.parametrize("use_numba", [True, False])
+def test_identify_stereoisomers_with_activity_cliff_classification(use_numba, monkeypatch):
+    from auroris.curation.actions import _ac_stereoisomer
+
+    if not use_numba:
+        monkeypatch.setattr(_ac_stereoisomer, "_group_range_kernel", None)
+
+    data = pd.DataFrame(
+        {
+            "data_col": [0, 1, 1, 1, 0, np.nan, 1, 0, 1],
+            "groupby_col": [0, 0, 1, 1, 2, 2, 3, None, None],
+        },
+        index=[10, 11, 12, 13, 14, 15, 16, 17, 18],
+    )
+    df = detect_streoisomer_activity_cliff(
+        dataset=data,
+        stereoisomer_id_col="groupby_col",
+        y_cols=["data_col"],
+    )
+    assert df["AC_data_col"].tolist() == [True, True, False, False, False, False, False, False, False]
+
+
+@pytest.mark.parametrize("verbosity", [VerbosityLevel.SILENT, VerbosityLevel.NORMAL])
+def test_stereoisomer_ac_detection_report(verbosity):
+    data = pd.DataFrame(
+        {
+            "smiles": ["C[C@H](N)O", "C[C@@H](N)O", "C[C@H](F)Cl", "C[C@@H](F)Cl"],
+            "data_col": [1.0, 100.0, 1.0, 1.1],
+            "groupby_col": [0, 0, 1, 1],
+        }
+    )
+    action = StereoIsomerACDetection(stereoisomer_id_col="groupby_col", y_cols=["data_col"], mol_col="smiles")
+
+    report = CurationReport()
+    with report.section(action.name):
+        df = action.transform(data, report=report, verbosity=verbosity)
+
+    assert df["AC_data_col"].tolist() == [True, True, False, False]
+    assert len(report.sections[0].images) == int(verbosity > VerbosityLevel.SILENT)